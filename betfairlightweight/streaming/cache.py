@@ -1,3 +1,4 @@
+from bisect import bisect_left
 from typing import Union
 
 from ..resources import (
@@ -16,6 +17,14 @@ from ..enums import (
 )
 from ..utils import create_date_string
 
+# {name: value} lookups, quicker than Enum[name].value
+_SIDE_VALUES = {k: v.value for k, v in StreamingSide.__members__.items()}
+_STATUS_VALUES = {k: v.value for k, v in StreamingStatus.__members__.items()}
+_PERSISTENCE_TYPE_VALUES = {
+    k: v.value for k, v in StreamingPersistenceType.__members__.items()
+}
+_ORDER_TYPE_VALUES = {k: v.value for k, v in StreamingOrderType.__members__.items()}
+
 
 class Available:
     """
@@ -28,6 +37,7 @@ class Available:
         "deletion_select",
         "reverse",
         "serialised",
+        "_keys",
     ]
 
     def __init__(self, prices: list, deletion_select: int, reverse: bool = False):
@@ -40,49 +50,87 @@ class Available:
         self.deletion_select = deletion_select
         self.reverse = reverse
         self.serialised = []
-        self.update(prices or [])
+        self._keys = []  # sorted (ascending) order_book keys
+        if prices:
+            self.update(prices)
 
     def update(self, book_update: list) -> None:
+        if not book_update:
+            return
         deletion_select = self.deletion_select  # local vars
+        price_select = deletion_select - 1
+        reverse = self.reverse
+        order_book, keys = self.order_book, self._keys
+        # copy to keep previous serialised (already published) untouched
+        serialised = self.serialised.copy()
         for book in book_update:
-            book = book.copy()  # create copy to keep streaming_update raw
             key = book[0]  # price or position
-            if book[deletion_select] == 0:
+            size = book[deletion_select]
+            if size == 0:
                 # remove price/size
                 try:
-                    del self.order_book[key]
+                    del order_book[key]
                 except KeyError:
                     continue
+                i = bisect_left(keys, key)
+                del keys[i]
+                del serialised[len(keys) - i if reverse else i]
             else:
+                # new list to keep streaming_update raw,
                 # serialise once and cache in the book
-                book.append(
-                    {
-                        "price": book[deletion_select - 1],
-                        "size": book[deletion_select],
-                    }
-                )
-                if key not in self.order_book:
-                    # new price requiring a reorder
-                    # to the book.
-                    self.order_book[key] = book
-                    self._sort_order_book()
+                book = [*book, {"price": book[price_select], "size": size}]
+                i = bisect_left(keys, key)
+                if key in order_book:
+                    # update price/size in place
+                    serialised[len(keys) - 1 - i if reverse else i] = book[-1]
                 else:
-                    # update book
-                    self.order_book[key] = book
-        self.serialise()
+                    # new price, insert keeping the book sorted
+                    serialised.insert(len(keys) - i if reverse else i, book[-1])
+                    keys.insert(i, key)
+                order_book[key] = book
+        self.serialised = serialised
 
     def clear(self) -> None:
         self.order_book = {}
+        self._keys = []
         self.serialise()
 
     def serialise(self) -> None:
-        self.serialised = [book[-1] for book in self.order_book.values()]
-
-    def _sort_order_book(self) -> None:
-        self.order_book = dict(sorted(self.order_book.items(), reverse=self.reverse))
+        order_book = self.order_book
+        keys = reversed(self._keys) if self.reverse else self._keys
+        self.serialised = [order_book[key][-1] for key in keys]
 
 
 class RunnerBookCache:
+    __slots__ = [
+        "selection_id",
+        "lightweight",
+        "last_price_traded",
+        "total_matched",
+        "traded",
+        "available_to_back",
+        "best_available_to_back",
+        "best_display_available_to_back",
+        "available_to_lay",
+        "best_available_to_lay",
+        "best_display_available_to_lay",
+        "_available_to_back",
+        "_available_to_lay",
+        "starting_price_back",
+        "starting_price_lay",
+        "starting_price_near",
+        "starting_price_far",
+        "handicap",
+        "definition",
+        "_definition_status",
+        "_definition_bsp",
+        "_definition_adjustment_factor",
+        "_definition_removal_date",
+        "serialised",
+        "_serialised_sp",
+        "resource",
+    ]
+
     def __init__(
         self,
         id: int,
@@ -114,6 +162,10 @@ class RunnerBookCache:
         self.available_to_lay = Available(atl, 1)
         self.best_available_to_lay = Available(batl, 2)
         self.best_display_available_to_lay = Available(bdatl, 2)
+        self._available_to_back = None  # ladder used in serialisation
+        self._available_to_lay = None
+        self.select_available_to_back()
+        self.select_available_to_lay()
         self.starting_price_back = Available(spb, 1, True)
         self.starting_price_lay = Available(spl, 1)
         self.starting_price_near = spn
@@ -126,6 +178,7 @@ class RunnerBookCache:
         self._definition_removal_date = None
         self.update_definition(self.definition)
         self.serialised = {}  # cache is king
+        self._serialised_sp = None  # None when sp values have changed
         self.resource = None
 
     def update_definition(self, definition: dict) -> None:
@@ -135,6 +188,7 @@ class RunnerBookCache:
         self._definition_bsp = self.definition.get("bsp")
         self._definition_adjustment_factor = self.definition.get("adjustmentFactor")
         self._definition_removal_date = self.definition.get("removalDate")
+        self._serialised_sp = None
 
     def update_traded(self, traded_update: list) -> None:
         """:param traded_update: [price, size]"""
@@ -143,24 +197,54 @@ class RunnerBookCache:
         else:
             self.traded.update(traded_update)
 
-    def serialise_available_to_back(self) -> list:
+    def select_available_to_back(self) -> None:
+        """Cache the back ladder to serialise, to be
+        called when any of atb/bdatb/batb are updated.
+        """
         if self.available_to_back.order_book:
-            return self.available_to_back.serialised
+            self._available_to_back = self.available_to_back
         elif self.best_display_available_to_back.order_book:
-            return self.best_display_available_to_back.serialised
+            self._available_to_back = self.best_display_available_to_back
         elif self.best_available_to_back.order_book:
-            return self.best_available_to_back.serialised
+            self._available_to_back = self.best_available_to_back
         else:
-            return []
+            self._available_to_back = None
 
-    def serialise_available_to_lay(self) -> list:
+    def select_available_to_lay(self) -> None:
+        """Cache the lay ladder to serialise, to be
+        called when any of atl/bdatl/batl are updated.
+        """
         if self.available_to_lay.order_book:
-            return self.available_to_lay.serialised
+            self._available_to_lay = self.available_to_lay
         elif self.best_display_available_to_lay.order_book:
-            return self.best_display_available_to_lay.serialised
+            self._available_to_lay = self.best_display_available_to_lay
         elif self.best_available_to_lay.order_book:
-            return self.best_available_to_lay.serialised
-        return []
+            self._available_to_lay = self.best_available_to_lay
+        else:
+            self._available_to_lay = None
+
+    def serialise_available_to_back(self) -> list:
+        if self._available_to_back is None:
+            return []
+        return self._available_to_back.serialised
+
+    def serialise_available_to_lay(self) -> list:
+        if self._available_to_lay is None:
+            return []
+        return self._available_to_lay.serialised
+
+    def serialise_starting_price(self) -> dict:
+        # sp rarely changes so the dict is reused
+        # across serialisations until invalidated
+        if self._serialised_sp is None:
+            self._serialised_sp = {
+                "nearPrice": self.starting_price_near,
+                "farPrice": self.starting_price_far,
+                "backStakeTaken": self.starting_price_lay.serialised,
+                "layLiabilityTaken": self.starting_price_back.serialised,
+                "actualSP": self._definition_bsp,
+            }
+        return self._serialised_sp
 
     def serialise(self) -> None:
         self.serialised = {
@@ -170,13 +254,7 @@ class RunnerBookCache:
                 "availableToBack": self.serialise_available_to_back(),
                 "availableToLay": self.serialise_available_to_lay(),
             },
-            "sp": {
-                "nearPrice": self.starting_price_near,
-                "farPrice": self.starting_price_far,
-                "backStakeTaken": self.starting_price_lay.serialised,
-                "layLiabilityTaken": self.starting_price_back.serialised,
-                "actualSP": self._definition_bsp,
-            },
+            "sp": self.serialise_starting_price(),
             "adjustmentFactor": self._definition_adjustment_factor,
             "removalDate": self._definition_removal_date,
             "lastPriceTraded": self.last_price_traded,
@@ -213,6 +291,8 @@ class MarketBookCache(BaseResource):
         self.runners = []
         self.runner_dict = {}
         self._number_of_runners = 0
+        self._update_count = 0
+        self._serialised_runners = None  # (update count, runners serialised)
 
     def update_cache(self, market_change: dict, publish_time: int) -> None:
         self.streaming_update = market_change
@@ -225,39 +305,54 @@ class MarketBookCache(BaseResource):
             self.total_matched = market_change["tv"]
 
         if "rc" in market_change:
+            runner_dict = self.runner_dict  # local var, new runners added in place
             for new_data in market_change["rc"]:
-                runner = self.runner_dict.get((new_data["id"], new_data.get("hc", 0)))
-                if runner:
+                runner = runner_dict.get((new_data["id"], new_data.get("hc", 0)))
+                if runner is not None:
                     if "ltp" in new_data:
                         runner.last_price_traded = new_data["ltp"]
                     if "tv" in new_data:  # if runner removed tv: 0 is returned
                         runner.total_matched = new_data["tv"]
                     if "spn" in new_data:
                         runner.starting_price_near = new_data["spn"]
+                        runner._serialised_sp = None
                     if "spf" in new_data:
                         runner.starting_price_far = new_data["spf"]
+                        runner._serialised_sp = None
                     if "trd" in new_data:
                         runner.update_traded(new_data["trd"])
                     if "atb" in new_data:
                         runner.available_to_back.update(new_data["atb"])
+                        runner.select_available_to_back()
                     if "atl" in new_data:
                         runner.available_to_lay.update(new_data["atl"])
+                        runner.select_available_to_lay()
                     if "batb" in new_data:
                         runner.best_available_to_back.update(new_data["batb"])
+                        runner.select_available_to_back()
                     if "batl" in new_data:
                         runner.best_available_to_lay.update(new_data["batl"])
+                        runner.select_available_to_lay()
                     if "bdatb" in new_data:
                         runner.best_display_available_to_back.update(new_data["bdatb"])
+                        runner.select_available_to_back()
                     if "bdatl" in new_data:
                         runner.best_display_available_to_lay.update(new_data["bdatl"])
+                        runner.select_available_to_lay()
                     if "spb" in new_data:
                         runner.starting_price_back.update(new_data["spb"])
+                        runner._serialised_sp = None
                     if "spl" in new_data:
                         runner.starting_price_lay.update(new_data["spl"])
+                        runner._serialised_sp = None
                 else:
                     runner = self._add_new_runner(**new_data)
                 runner.serialise()
 
+        # incremented once the update is complete so that a
+        # concurrent serialise cannot cache a partial update
+        self._update_count += 1
+
     def _process_market_definition(self, market_definition: dict) -> None:
         self.market_definition = market_definition
         if self.lightweight is False:  # cache resource
@@ -299,9 +394,7 @@ class MarketBookCache(BaseResource):
         self.runners.append(runner)
         self._number_of_runners = len(self.runners)
         # update runner_dict
-        self.runner_dict = {
-            (runner.selection_id, runner.handicap): runner for runner in self.runners
-        }
+        self.runner_dict[(runner.selection_id, runner.handicap)] = runner
         return runner
 
     def create_resource(
@@ -334,6 +427,13 @@ class MarketBookCache(BaseResource):
         will contain missing data if EX_MARKET_DEF
         not incl.
         """
+        update_count = self._update_count
+        serialised_runners = self._serialised_runners
+        if serialised_runners is None or serialised_runners[0] != update_count:
+            serialised_runners = self._serialised_runners = (
+                update_count,
+                [runner.serialised for runner in self.runners],
+            )
         return {
             "marketId": self.market_id,
             "totalAvailable": None,
@@ -351,7 +451,7 @@ class MarketBookCache(BaseResource):
             "numberOfWinners": self._definition_number_of_winners,
             "numberOfRunners": self._number_of_runners,
             "numberOfActiveRunners": self._definition_number_of_active_runners,
-            "runners": [runner.serialised for runner in self.runners],
+            "runners": serialised_runners[1],
             "publishTime": self.publish_time,
             "priceLadderDefinition": self._definition_price_ladder_definition,
             "keyLineDescription": self._definition_key_line_description,
@@ -361,6 +461,41 @@ class MarketBookCache(BaseResource):
 
 
 class UnmatchedOrder:
+    __slots__ = [
+        "bet_id",
+        "price",
+        "size",
+        "bsp_liability",
+        "side",
+        "status",
+        "persistence_type",
+        "order_type",
+        "placed_date",
+        "_placed_date_string",
+        "matched_date",
+        "_matched_date_string",
+        "average_price_matched",
+        "size_matched",
+        "size_remaining",
+        "size_lapsed",
+        "size_cancelled",
+        "size_voided",
+        "regulator_auth_code",
+        "regulator_code",
+        "reference_order",
+        "reference_strategy",
+        "lapsed_date",
+        "_lapsed_date_string",
+        "lapse_status_reason_code",
+        "cancelled_date",
+        "_cancelled_date_string",
+        "_side_value",
+        "_status_value",
+        "_persistence_type_value",
+        "_order_type_value",
+        "serialised",
+    ]
+
     def __init__(
         self,
         id: str,
@@ -415,8 +550,56 @@ class UnmatchedOrder:
         self.lapse_status_reason_code = lsrc
         self.cancelled_date = BaseResource.strip_datetime(cd)
         self._cancelled_date_string = create_date_string(self.cancelled_date)
+        # cache enum values used in serialisation
+        self._side_value = _SIDE_VALUES[side]
+        self._status_value = _STATUS_VALUES[status]
+        self._persistence_type_value = _PERSISTENCE_TYPE_VALUES[pt] if pt else None
+        self._order_type_value = _ORDER_TYPE_VALUES[ot]
         self.serialised = {}  # cache is king
 
+    def update(
+        self,
+        status: str,
+        sm: float,
+        sr: float,
+        sl: float,
+        sc: float,
+        sv: float,
+        pt: str = None,
+        md: str = None,
+        avp: float = None,
+        ld: int = None,
+        lsrc: str = None,
+        cd: int = None,
+        **kwargs
+    ) -> None:
+        # only the fields which can change once an order is placed
+        if status != self.status:
+            self.status = status
+            self._status_value = _STATUS_VALUES[status]
+        if pt != self.persistence_type:
+            self.persistence_type = pt
+            self._persistence_type_value = _PERSISTENCE_TYPE_VALUES[pt] if pt else None
+        matched_date = BaseResource.strip_datetime(md)
+        if matched_date != self.matched_date:
+            self.matched_date = matched_date
+            self._matched_date_string = create_date_string(matched_date)
+        self.average_price_matched = avp
+        self.size_matched = sm
+        self.size_remaining = sr
+        self.size_lapsed = sl
+        self.size_cancelled = sc
+        self.size_voided = sv
+        lapsed_date = BaseResource.strip_datetime(ld)
+        if lapsed_date != self.lapsed_date:
+            self.lapsed_date = lapsed_date
+            self._lapsed_date_string = create_date_string(lapsed_date)
+        self.lapse_status_reason_code = lsrc
+        cancelled_date = BaseResource.strip_datetime(cd)
+        if cancelled_date != self.cancelled_date:
+            self.cancelled_date = cancelled_date
+            self._cancelled_date_string = create_date_string(cancelled_date)
+
     def serialise(self, market_id: str, selection_id: int, handicap: int):
         self.serialised = {
             "averagePriceMatched": self.average_price_matched or 0.0,
@@ -425,22 +608,20 @@ class UnmatchedOrder:
             "handicap": handicap,
             "marketId": market_id,
             "matchedDate": self._matched_date_string,
-            "orderType": StreamingOrderType[self.order_type].value,
-            "persistenceType": StreamingPersistenceType[self.persistence_type].value
-            if self.persistence_type
-            else None,
+            "orderType": self._order_type_value,
+            "persistenceType": self._persistence_type_value,
             "placedDate": self._placed_date_string,
             "priceSize": {"price": self.price, "size": self.size},
             "regulatorAuthCode": self.regulator_auth_code,
             "regulatorCode": self.regulator_code,
             "selectionId": selection_id,
-            "side": StreamingSide[self.side].value,
+            "side": self._side_value,
             "sizeCancelled": self.size_cancelled,
             "sizeLapsed": self.size_lapsed,
             "sizeMatched": self.size_matched,
             "sizeRemaining": self.size_remaining,
             "sizeVoided": self.size_voided,
-            "status": StreamingStatus[self.status].value,
+            "status": self._status_value,
             "customerStrategyRef": self.reference_strategy,
             "customerOrderRef": self.reference_order,
             "lapsedDate": self._lapsed_date_string,
@@ -450,6 +631,17 @@ class UnmatchedOrder:
 
 
 class OrderBookRunner:
+    __slots__ = [
+        "market_id",
+        "selection_id",
+        "full_image",
+        "matched_lays",
+        "matched_backs",
+        "unmatched_orders",
+        "handicap",
+        "strategy_matches",
+    ]
+
     def __init__(
         self,
         market_id: str,
@@ -473,9 +665,14 @@ class OrderBookRunner:
 
     def update_unmatched(self, unmatched_orders: list) -> None:
         for unmatched_order in unmatched_orders:
-            order = UnmatchedOrder(**unmatched_order)
-            order.serialise(self.market_id, self.selection_id, self.handicap)
-            self.unmatched_orders[order.bet_id] = order
+            order = self.unmatched_orders.get(unmatched_order["id"])
+            if order is None:
+                order = UnmatchedOrder(**unmatched_order)
+                order.serialise(self.market_id, self.selection_id, self.handicap)
+                self.unmatched_orders[order.bet_id] = order
+            else:
+                order.update(**unmatched_order)
+                order.serialise(self.market_id, self.selection_id, self.handicap)
 
     def serialise_orders(self) -> list:
         orders = list(self.unmatched_orders.values())  # order may be added (#232)
@@ -535,10 +732,12 @@ class OrderBookCache(BaseResource):
     @property
     def serialise(self) -> dict:
         runners = list(self.runners.values())  # runner may be added
-        orders, matches = [], []
-        for runner in runners:
-            orders.extend(runner.serialise_orders())
-            matches.append(runner.serialise_matches())
+        orders = [
+            order.serialised
+            for runner in runners
+            for order in list(runner.unmatched_orders.values())  # (#232)
+        ]
+        matches = [runner.serialise_matches() for runner in runners]
         return {
             "currentOrders": orders,
             "matches": matches,
@@ -1,5 +1,6 @@
 import requests
 import datetime
+import functools
 from typing import Optional
 
 from .compat import BETFAIR_DATE_FORMAT
@@ -67,6 +68,7 @@ def default_user_agent():
     return "{0}/{1}".format(__title__, __version__)
 
 
+@functools.lru_cache()
 def create_date_string(date: datetime.datetime) -> Optional[str]:
     """
     Convert datetime to betfair
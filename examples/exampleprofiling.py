@@ -0,0 +1,46 @@
+import sys
+import cProfile
+import pstats
+
+import betfairlightweight
+from betfairlightweight import StreamListener
+
+"""
+Profile the streaming cache by replaying a historical
+data file, data can be downloaded from:
+    https://historicdata.betfair.com
+
+For a sampling profile / flamegraph use py-spy:
+    py-spy record -r 500 -o cache.svg -- python examples/exampleprofiling.py
+"""
+
+# file to replay (update file_path to your file location)
+file_path = (
+    sys.argv[1]
+    if len(sys.argv) > 1
+    else "tests/resources/historicaldata/BASIC-1.132153978"
+)
+
+# create trading instance (don't need username/password)
+trading = betfairlightweight.APIClient("username", "password", app_key="appKey")
+
+
+def replay(lightweight: bool) -> None:
+    # create historical stream and process every update
+    stream = trading.streaming.create_historical_generator_stream(
+        file_path=file_path,
+        listener=StreamListener(max_latency=None, lightweight=lightweight),
+    )
+    gen = stream.get_generator()
+    for market_books in gen():
+        pass
+
+
+for lightweight in (True, False):
+    profiler = cProfile.Profile()
+    profiler.runcall(replay, lightweight)
+
+    # print top functions by own time within the streaming cache
+    print("lightweight: %s" % lightweight)
+    stats = pstats.Stats(profiler).sort_stats("tottime")
+    stats.print_stats("streaming/cache.py", 10)
@@ -34,6 +34,14 @@ class TestAvailable(unittest.TestCase):
             [{"price": 1.01, "size": 12}, {"price": 1.02, "size": 34.45}],
         )
 
+    @mock.patch("betfairlightweight.streaming.cache.Available.update")
+    def test_init_empty(self, mock_update):
+        for prices in (None, []):
+            available = Available(prices, 1)
+            self.assertEqual(available.order_book, {})
+            self.assertEqual(available.serialised, [])
+        mock_update.assert_not_called()
+
     def test_serialise(self):
         # [price, size]
         current = [[27, 0.95], [13, 28.01], [1.02, 1157.21]]
@@ -67,17 +75,12 @@ class TestAvailable(unittest.TestCase):
         assert self.available.order_book == {}
         mock_serialise.assert_called()
 
-    def test__sort_order_book(self):
-        self.available.order_book = {1.01: [2], 100: [3], 13: [5]}
-        self.available._sort_order_book()
-        self.assertEqual(list(self.available.order_book.keys()), [1.01, 13, 100])
-        # reverse
-        self.available.reverse = True
-        self.available._sort_order_book()
-        self.assertEqual(list(self.available.order_book.keys()), [100, 13, 1.01])
+    def test_update_empty(self):
+        serialised = self.available.serialised
+        self.available.update([])
+        self.assertIs(self.available.serialised, serialised)
 
-    @mock.patch("betfairlightweight.streaming.cache.Available.serialise")
-    def test_update(self, mock_serialise):
+    def test_update(self):
         book_update = [[27, 2]]  # [price, size]
         current = [[27, 0.95], [13, 28.01], [1.02, 1157.21]]
         expected = {
@@ -87,13 +90,20 @@ class TestAvailable(unittest.TestCase):
         }
 
         available = Available(current, 1)
+        previous = available.serialised
         available.update(book_update)
-        mock_serialise.assert_called()
         self.assertEqual(available.order_book, expected)
+        self.assertEqual(
+            available.serialised,
+            [
+                {"price": 1.02, "size": 1157.21},
+                {"price": 13, "size": 28.01},
+                {"price": 27, "size": 2},
+            ],
+        )
+        self.assertEqual(previous[2], {"price": 27, "size": 0.95})
 
-    @mock.patch("betfairlightweight.streaming.cache.Available._sort_order_book")
-    @mock.patch("betfairlightweight.streaming.cache.Available.serialise")
-    def test_update_new(self, mock_serialise, mock__sort_order_book):
+    def test_update_new(self):
         book_update = [[30, 6.9]]  # [price, size]
         current = [[27, 0.95], [13, 28.01], [1.02, 1157.21]]
         expected = {
@@ -105,12 +115,50 @@ class TestAvailable(unittest.TestCase):
 
         available = Available(current, 1)
         available.update(book_update)
-        mock_serialise.assert_called()
-        mock__sort_order_book.assert_called()
         self.assertEqual(available.order_book, expected)
+        self.assertEqual(available._keys, [1.02, 13, 27, 30])
+        self.assertEqual(available.serialised[-1], {"price": 30, "size": 6.9})
 
-    @mock.patch("betfairlightweight.streaming.cache.Available.serialise")
-    def test_update_del(self, mock_serialise):
+    def test_update_new_multiple(self):
+        book_update = [[30, 6.9], [1.01, 12], [13, 2]]  # [price, size]
+        current = [[27, 0.95], [13, 28.01], [1.02, 1157.21]]
+        available = Available(current, 1, True)
+        available.update(book_update)
+        self.assertEqual(available._keys, [1.01, 1.02, 13, 27, 30])
+        self.assertEqual(
+            available.serialised,
+            [
+                {"price": 30, "size": 6.9},
+                {"price": 27, "size": 0.95},
+                {"price": 13, "size": 2},
+                {"price": 1.02, "size": 1157.21},
+                {"price": 1.01, "size": 12},
+            ],
+        )
+
+    def test_update_reverse_del(self):
+        book_update = [[13, 0], [40, 1], [1.01, 0]]  # [price, size]
+        current = [[27, 0.95], [13, 28.01], [1.02, 1157.21]]
+        available = Available(current, 1, True)
+        available.update(book_update)
+        self.assertEqual(available._keys, [1.02, 27, 40])
+        self.assertEqual(
+            available.serialised,
+            [
+                {"price": 40, "size": 1},
+                {"price": 27, "size": 0.95},
+                {"price": 1.02, "size": 1157.21},
+            ],
+        )
+
+    def test_update_raw(self):
+        book_update = [[27, 2], [13, 0]]  # [price, size]
+        available = Available([[27, 0.95], [13, 28.01]], 1)
+        available.update(book_update)
+        self.assertEqual(book_update, [[27, 2], [13, 0]])
+        self.assertEqual(available.order_book, {27: [27, 2, {"price": 27, "size": 2}]})
+
+    def test_update_del(self):
         book_update = [[27, 0]]  # [price, size]
         current = [[27, 0.95], [13, 28.01], [1.02, 1157.21]]
         expected = {
@@ -120,12 +168,13 @@ class TestAvailable(unittest.TestCase):
 
         available = Available(current, 1)
         available.update(book_update)
-        mock_serialise.assert_called()
         self.assertEqual(available.order_book, expected)
+        self.assertEqual(
+            available.serialised,
+            [{"price": 1.02, "size": 1157.21}, {"price": 13, "size": 28.01}],
+        )
 
-    @mock.patch("betfairlightweight.streaming.cache.Available._sort_order_book")
-    @mock.patch("betfairlightweight.streaming.cache.Available.serialise")
-    def test_update_available_new_update(self, mock_serialise, mock__sort_order_book):
+    def test_update_available_new_update(self):
         # [price, size]
         book_update = [[30, 6.9]]
         current = [[27, 0.95], [13, 28.01], [1.02, 1157.21]]
@@ -160,9 +209,7 @@ class TestAvailable(unittest.TestCase):
         available.update(book_update)
         assert available.order_book == expected
 
-    @mock.patch("betfairlightweight.streaming.cache.Available._sort_order_book")
-    @mock.patch("betfairlightweight.streaming.cache.Available.serialise")
-    def test_update_available_new_replace(self, mock_serialise, mock__sort_order_book):
+    def test_update_available_new_replace(self):
         # [price, size]
         book_update = [[27, 6.9]]
         current = [[27, 0.95], [13, 28.01], [1.02, 1157.21]]
@@ -197,9 +244,7 @@ class TestAvailable(unittest.TestCase):
         available.update(book_update)
         assert available.order_book == expected
 
-    @mock.patch("betfairlightweight.streaming.cache.Available._sort_order_book")
-    @mock.patch("betfairlightweight.streaming.cache.Available.serialise")
-    def test_update_available_new_remove(self, mock_serialise, mock__sort_order_book):
+    def test_update_available_new_remove(self):
         # [price, size]
         book_update = [[27, 0]]
         current = [[27, 0.95], [13, 28.01], [1.02, 1157.21]]
@@ -247,6 +292,8 @@ class TestMarketBookCache(unittest.TestCase):
         self.assertEqual(self.market_book_cache.runners, [])
         self.assertEqual(self.market_book_cache.runner_dict, {})
         self.assertEqual(self.market_book_cache._number_of_runners, 0)
+        self.assertEqual(self.market_book_cache._update_count, 0)
+        self.assertIsNone(self.market_book_cache._serialised_runners)
 
     @mock.patch("betfairlightweight.streaming.cache.MarketBookCache.strip_datetime")
     def test_update_cache_md(self, mock_strip_datetime):
@@ -286,6 +333,25 @@ class TestMarketBookCache(unittest.TestCase):
 
         assert len(market_book_cache.runners) == len(market_book_cache.runner_dict)
 
+    def test_update_cache_sp(self):
+        market_book_cache = MarketBookCache("1.123", 123, True)
+        market_book_cache.update_cache({"rc": [{"id": 13536143, "spn": 2}]}, 123)
+        runner = market_book_cache.runners[0]
+        sp = runner.serialised["sp"]
+        self.assertEqual(sp["nearPrice"], 2)
+
+        market_book_cache.update_cache({"rc": [{"id": 13536143, "ltp": 3}]}, 124)
+        self.assertIs(runner.serialised["sp"], sp)
+
+        market_book_cache.update_cache(
+            {"rc": [{"id": 13536143, "spn": 3, "spb": [[1.01, 2]]}]}, 125
+        )
+        self.assertEqual(runner.serialised["sp"]["nearPrice"], 3)
+        self.assertEqual(
+            runner.serialised["sp"]["layLiabilityTaken"], [{"price": 1.01, "size": 2}]
+        )
+        self.assertEqual(sp["nearPrice"], 2)
+
     # @mock.patch('betfairlightweight.resources.streamingresources.MarketBookCache.strip_datetime')
     # def test_update_cache_rc(self, mock_strip_datetime):
     #     publish_time = mock.Mock()
@@ -424,6 +490,20 @@ class TestMarketBookCache(unittest.TestCase):
         self.assertEqual(self.market_book_cache.runners, [mock_runner_book_cache()])
         self.assertEqual(self.market_book_cache._number_of_runners, 1)
 
+    def test_serialise_runners_cached(self):
+        self.market_book_cache.update_cache({"rc": [{"id": 1, "ltp": 2}]}, 123)
+        self.assertEqual(self.market_book_cache._update_count, 1)
+        runners = self.market_book_cache.serialise["runners"]
+        self.assertEqual(runners[0]["lastPriceTraded"], 2)
+        self.assertIs(self.market_book_cache.serialise["runners"], runners)
+
+        self.market_book_cache.update_cache({"rc": [{"id": 1, "ltp": 3}]}, 124)
+        self.assertEqual(self.market_book_cache._update_count, 2)
+        self.assertEqual(
+            self.market_book_cache.serialise["runners"][0]["lastPriceTraded"], 3
+        )
+        self.assertEqual(runners[0]["lastPriceTraded"], 2)
+
     def test_closed(self):
         self.assertFalse(self.market_book_cache.closed)
         self.market_book_cache.market_definition = {"status": "CLOSED"}
@@ -463,7 +543,7 @@ class TestRunnerBookCache(unittest.TestCase):
         self.runner_book.update_traded([1, 2])
         self.mock_traded.update.assert_called_with([1, 2])
 
-    def test_serialise_back(self):
+    def test_select_available_to_back(self):
         mock_available_to_back = mock.Mock()
         mock_available_to_back.order_book = True
         mock_best_available_to_back = mock.Mock()
@@ -472,6 +552,7 @@ class TestRunnerBookCache(unittest.TestCase):
         mock_best_display_available_to_back.order_book = True
         self.runner_book.available_to_back = mock_available_to_back
 
+        self.runner_book.select_available_to_back()
         assert (
             self.runner_book.serialise_available_to_back()
             == mock_available_to_back.serialised
@@ -479,6 +560,7 @@ class TestRunnerBookCache(unittest.TestCase):
 
         mock_available_to_back.order_book = False
         self.runner_book.best_available_to_back = mock_best_available_to_back
+        self.runner_book.select_available_to_back()
         assert (
             self.runner_book.serialise_available_to_back()
             == mock_best_available_to_back.serialised
@@ -488,12 +570,23 @@ class TestRunnerBookCache(unittest.TestCase):
         self.runner_book.best_display_available_to_back = (
             mock_best_display_available_to_back
         )
+        self.runner_book.select_available_to_back()
         assert (
             self.runner_book.serialise_available_to_back()
             == mock_best_display_available_to_back.serialised
         )
 
-    def test_serialise_lay(self):
+    def test_serialise_available_to_back(self):
+        self.assertEqual(self.runner_book.serialise_available_to_back(), [])
+        self.runner_book.available_to_back.update([[1.01, 2]])
+        self.assertEqual(self.runner_book.serialise_available_to_back(), [])
+        self.runner_book.select_available_to_back()
+        self.assertEqual(
+            self.runner_book.serialise_available_to_back(),
+            [{"price": 1.01, "size": 2}],
+        )
+
+    def test_select_available_to_lay(self):
         mock_available_to_lay = mock.Mock()
         mock_available_to_lay.order_book = True
         mock_best_available_to_lay = mock.Mock()
@@ -502,6 +595,7 @@ class TestRunnerBookCache(unittest.TestCase):
         mock_best_display_available_to_lay.order_book = True
         self.runner_book.available_to_lay = mock_available_to_lay
 
+        self.runner_book.select_available_to_lay()
         assert (
             self.runner_book.serialise_available_to_lay()
             == mock_available_to_lay.serialised
@@ -509,6 +603,7 @@ class TestRunnerBookCache(unittest.TestCase):
 
         mock_available_to_lay.order_book = False
         self.runner_book.best_available_to_lay = mock_best_available_to_lay
+        self.runner_book.select_available_to_lay()
         assert (
             self.runner_book.serialise_available_to_lay()
             == mock_best_available_to_lay.serialised
@@ -518,11 +613,22 @@ class TestRunnerBookCache(unittest.TestCase):
         self.runner_book.best_display_available_to_lay = (
             mock_best_display_available_to_lay
         )
+        self.runner_book.select_available_to_lay()
         assert (
             self.runner_book.serialise_available_to_lay()
             == mock_best_display_available_to_lay.serialised
         )
 
+    def test_serialise_available_to_lay(self):
+        self.assertEqual(self.runner_book.serialise_available_to_lay(), [])
+        self.runner_book.available_to_lay.update([[1.01, 2]])
+        self.assertEqual(self.runner_book.serialise_available_to_lay(), [])
+        self.runner_book.select_available_to_lay()
+        self.assertEqual(
+            self.runner_book.serialise_available_to_lay(),
+            [{"price": 1.01, "size": 2}],
+        )
+
     def test_serialise(self):
         self.runner_book._definition_status = "ACTIVE"
         self.runner_book._definition_bsp = 12
@@ -549,6 +655,23 @@ class TestRunnerBookCache(unittest.TestCase):
             },
         )
 
+    def test_serialise_starting_price(self):
+        sp = self.runner_book.serialise_starting_price()
+        self.assertEqual(
+            sp,
+            {
+                "actualSP": None,
+                "backStakeTaken": [],
+                "farPrice": None,
+                "layLiabilityTaken": [],
+                "nearPrice": None,
+            },
+        )
+        self.assertIs(self.runner_book.serialise_starting_price(), sp)
+        self.runner_book.update_definition({"bsp": 2.02})
+        self.assertEqual(self.runner_book.serialise_starting_price()["actualSP"], 2.02)
+        self.assertEqual(sp["actualSP"], None)
+
     def test_empty_serialise(self):
         self.runner_book.serialise()
 
@@ -650,10 +773,13 @@ class TestOrderBookCache(unittest.TestCase):
 
     def test_serialise(self):
         mock_runner_one = mock.Mock()
-        mock_runner_one.serialise_orders.return_value = [1]
+        mock_runner_one.unmatched_orders = {1: mock.Mock(serialised=1)}
         mock_runner_one.serialise_matches.return_value = 6
         mock_runner_two = mock.Mock()
-        mock_runner_two.serialise_orders.return_value = [2, 3]
+        mock_runner_two.unmatched_orders = {
+            2: mock.Mock(serialised=2),
+            3: mock.Mock(serialised=3),
+        }
         mock_runner_two.serialise_matches.return_value = 4
         self.order_book_cache.runners = {
             (123, 0): mock_runner_one,
@@ -738,7 +864,9 @@ class TestOrderBookRunner(unittest.TestCase):
                 "status": "EC",
             }
         ]
+        order = self.order_book_runner.unmatched_orders[2]
         self.order_book_runner.update_unmatched(unmatched_orders)
+        self.assertIs(self.order_book_runner.unmatched_orders[2], order)
         self.assertEqual(self.order_book_runner.unmatched_orders[1].status, "E")
         self.assertEqual(self.order_book_runner.unmatched_orders[2].status, "EC")
         self.assertEqual(
@@ -844,8 +972,46 @@ class TestUnmatchedOrder(unittest.TestCase):
         assert self.unmatched_order.lapsed_date == BaseResource.strip_datetime(16)
         assert self.unmatched_order.lapse_status_reason_code == 17
         assert self.unmatched_order.cancelled_date == BaseResource.strip_datetime(18)
+        assert self.unmatched_order._side_value == "LAY"
+        assert self.unmatched_order._status_value == "EXECUTABLE"
+        assert self.unmatched_order._persistence_type_value == "LAPSE"
+        assert self.unmatched_order._order_type_value == "LIMIT"
         assert self.unmatched_order.serialised == {}
 
+    def test_update(self):
+        self.unmatched_order.update(
+            status="EC",
+            pt="P",
+            sm=3,
+            sr=0,
+            sl=0,
+            sc=0,
+            sv=0,
+            md=5,
+            avp=2.02,
+            id=1,
+            p=99,
+        )
+        self.assertEqual(self.unmatched_order.price, 2)
+        self.assertEqual(self.unmatched_order.status, "EC")
+        self.assertEqual(self.unmatched_order._status_value, "EXECUTION_COMPLETE")
+        self.assertEqual(self.unmatched_order.persistence_type, "P")
+        self.assertEqual(self.unmatched_order._persistence_type_value, "PERSIST")
+        self.assertEqual(
+            self.unmatched_order.matched_date, BaseResource.strip_datetime(5)
+        )
+        self.assertEqual(
+            self.unmatched_order._matched_date_string, "1970-01-01T00:00:00.005000Z"
+        )
+        self.assertEqual(self.unmatched_order.average_price_matched, 2.02)
+        self.assertEqual(self.unmatched_order.size_matched, 3)
+        self.assertEqual(self.unmatched_order.size_remaining, 0)
+        self.assertIsNone(self.unmatched_order.lapsed_date)
+        self.assertIsNone(self.unmatched_order._lapsed_date_string)
+        self.assertIsNone(self.unmatched_order.lapse_status_reason_code)
+        self.assertIsNone(self.unmatched_order.cancelled_date)
+        self.assertIsNone(self.unmatched_order._cancelled_date_string)
+
     def test_serialise(self):
         self.unmatched_order.serialise("1.23", 12345, 0)
         self.assertEqual(
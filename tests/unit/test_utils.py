@@ -39,3 +39,10 @@ class UtilsTest(unittest.TestCase):
             utils.create_date_string(datetime.datetime(2020, 11, 27)),
             "2020-11-27T00:00:00.000000Z",
         )
+
+    def test_create_date_string_cached(self):
+        date = datetime.datetime(2020, 11, 28)
+        hits = utils.create_date_string.cache_info().hits
+        utils.create_date_string(date)
+        utils.create_date_string(date)
+        self.assertEqual(utils.create_date_string.cache_info().hits, hits + 1)